@@ -36,6 +36,7 @@ pytest_plugins = [
     "plugins.pytest_onsenv",  # initialize environment
     "plugins.pytest_skip_filter",  # remove skipped tests from run
     "plugins.pytest_random_collection",  # execute one test (random) from test suite
+    "testcases.sample_helpers",  # report wait_until timings
 ]
 
 
@@ -30,6 +30,8 @@ import pytest
 from testlib import helpers
 from testlib.custom_exceptions import SwitchException, UIException
 
+from testcases import sample_helpers
+
 # There are several types of predefined environment:
 # simplified: 3-5 links between one switch and traffic generator
 # golden: 3 switches connected to each other and to the traffic generator
@@ -150,52 +152,40 @@ class TestSwitchSamples(object):
         env.tg[1].start_streams(streams)
 
         # Stop capture
-        data = env.tg[1].stop_sniff(sniff_ports)
+        data = sample_helpers.IndexedSniffData(env.tg[1].stop_sniff(sniff_ports), env.tg[1])
 
         # Stop traffic
         env.tg[1].stop_streams(streams)
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         self.suite_logger.debug("Verify traffic is processed according to the FDB records")
         # Get packets from the captured data
         # Verify first packet is sent only to second port
         params_1 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:11:11:11'},
                     {"layer": "Ethernet", "field": 'src', "value": '00:00:00:02:02:02'}]
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[1],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[1],
+                                                 params=params_1)) == 1, \
             "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[2],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 0, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[2],
+                                                 params=params_1)) == 0, \
             "Packet is received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[3],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 0, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[3],
+                                                 params=params_1)) == 0, \
             "Packet is received"
 
         # Verify second packet is flooded
         params_1 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:03:03:03'},
                     {"layer": "Ethernet", "field": 'src', "value": '00:00:00:04:04:04'}]
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[1],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[1],
+                                                 params=params_1)) == 1, \
             "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[2],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[2],
+                                                 params=params_1)) == 1, \
             "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[3],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[3],
+                                                 params=params_1)) == 1, \
             "Packet is not received"
 
     def test_switch_special_operations(self, env):
@@ -31,6 +31,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.simplified
 class TestTGSamples(object):
@@ -156,8 +158,8 @@ class TestTGSamples(object):
         # TAF will wait 'sniffing_time' to stop capture
         data = env.tg[1].stop_sniff(tg_ports)
 
-        # Print captured frames in DEBUG mode
-        helpers.print_sniffed_data_brief(data)
+        # Print per port counters and only first and last captured frames in DEBUG mode
+        sample_helpers.print_sniffed_data_brief(data, max_frames=10)
 
         env.tg[1].stop_streams([stream_1, stream_2])
 
@@ -178,6 +180,19 @@ class TestTGSamples(object):
                                                     tg=env.tg[1])) == 5, \
             "Packets are not received"
 
+        # Count captured frames grouped by port and fields values
+        data = sample_helpers.IndexedSniffData(data, env.tg[1])
+        counts = data.get_packets_count([("Ethernet", "src")], sniff_ports=tg_ports[1:])
+        # Frames with unknown destination are flooded to all other ports
+        for port in tg_ports[1:]:
+            assert counts[port, '00:00:00:11:11:11'] == counts[port, '00:00:00:33:33:33'] == 5, \
+                "Packets are not flooded to port {0}".format(port)
+
+        # Count all captured frames on each port (including background traffic)
+        totals = data.get_packets_count([], sniff_ports=tg_ports[1:])
+        assert all(totals[port, ] >= 10 for port in tg_ports[1:]), \
+            "Packets are not received"
+
         # 2. Configure filter by layer: please see list of available
         # layers in testlib.packet_processor.flt_patterns .
         # Capture IP frames
@@ -190,7 +205,7 @@ class TestTGSamples(object):
         data = env.tg[1].stop_sniff(tg_ports)
 
         # Print captured frames
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         env.tg[1].stop_streams([stream_1, stream_2])
 
@@ -221,7 +236,7 @@ class TestTGSamples(object):
         data = env.tg[1].stop_sniff(tg_ports)
 
         # Print captured frames
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         env.tg[1].stop_streams([stream_1, stream_2])
 
@@ -252,7 +267,7 @@ class TestTGSamples(object):
         data = env.tg[1].stop_sniff(tg_ports)
 
         # Print captured frames
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         env.tg[1].stop_streams([stream_1, stream_2])
 
@@ -285,7 +300,7 @@ class TestTGSamples(object):
         data = env.tg[1].stop_sniff(tg_ports)
 
         # Print captured frames
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         env.tg[1].stop_streams([stream_1, stream_2])
 
@@ -318,7 +333,7 @@ class TestTGSamples(object):
         data = env.tg[1].stop_sniff([tg_ports[1], tg_ports[2]])
 
         # Print captured frames
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         env.tg[1].stop_streams([stream_1, stream_2])
 
@@ -391,7 +406,7 @@ class TestTGSamples(object):
         data = env.tg[1].stop_sniff(tg_ports)
 
         # Print captured frames in DEBUG mode
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify received frames
         params = [{"layer": "Ethernet", "field": 'src', "value": '00:00:33:33:33:33'},
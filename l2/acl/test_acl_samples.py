@@ -31,6 +31,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.acl
 @pytest.mark.simplified
@@ -258,7 +260,7 @@ class TestAclSamples(object):
         env.tg[1].stop_streams()
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Get packets from the captured data
         self.suite_logger.debug("Verify traffic is processed according to the ACLs")
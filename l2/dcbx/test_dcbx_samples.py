@@ -28,6 +28,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 def pytest_generate_tests(metafunc):
     """Py.test hook that generates test items based on type of PFC configuration on device"""
@@ -64,7 +66,7 @@ class TestDCBXSamples(object):
         @type  tg_inst:  GenericTG
         @param ports:  active ports for specific environment
         @type  ports:  dict{dict}
-        @ raise  AssertionError:  DCBx PFC configuration is not set to DcbxPfcPortsLocal
+        @ raise  pytest.fail:  DCBx PFC configuration is not set to DcbxPfcPortsLocal
         """
         switch_inst.ui.enable_dcbx_tlv_transmission(list(ports[("sw1", "tg1")].values()),
                                                     dcbx_tlvs=["tlvPfcTxEnable"],
@@ -84,14 +86,12 @@ class TestDCBXSamples(object):
         tg_inst.start_streams(dcbx_stream)
         time.sleep(0.5)
         tg_inst.stop_streams(dcbx_stream)
-        self.suite_logger.debug("Wait time to update PFC configuration in DcbxPfcPortsLocal table")
-        time.sleep(2)
-
         self.suite_logger.debug("Verify that PFC configuration is set in DcbxPfcPortsLocal table for egress port")
-        for port in ports[("sw1", "tg1")].values():
-            assert switch_inst.ui.get_table_dcbx_pfc(table_type="Local",
-                                                     port=port)[0]["enabled"] == '0,1,0,0,0,0,0,0', \
-                "DCBx PFC configuration is not set to DcbxPfcPortsLocal"
+        sample_helpers.wait_until(
+            lambda: all(switch_inst.ui.get_table_dcbx_pfc(table_type="Local",
+                                                          port=port)[0]["enabled"] == '0,1,0,0,0,0,0,0'
+                        for port in ports[("sw1", "tg1")].values()),
+            timeout=10, message="DCBx PFC configuration is set to DcbxPfcPortsLocal")
 
     def configure_pfc_manually_without_frame_sending(self, switch_inst, ports, traffic_class):
         """
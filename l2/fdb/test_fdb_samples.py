@@ -28,6 +28,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.fdb
 @pytest.mark.simplified
@@ -118,53 +120,22 @@ class TestFdbSamples(object):
         env.tg[1].start_streams(streams)
 
         # Stop capture
-        data = env.tg[1].stop_sniff(sniff_ports)
+        data = sample_helpers.IndexedSniffData(env.tg[1].stop_sniff(sniff_ports), env.tg[1])
 
         # Stop traffic
         env.tg[1].stop_streams()
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         self.suite_logger.debug("Verify traffic is processed according to the FDB records")
-        # Get packets from the captured data
-        # Verify first packet is sent only to second port
+        # Verify first packet is sent only to second port and second packet is flooded
         params_1 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:11:11:11'},
                     {"layer": "Ethernet", "field": 'src', "value": '00:00:00:02:02:02'}]
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[1],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
-            "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[2],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 0, \
-            "Packet is received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[3],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 0, \
-            "Packet is received"
-
-        # Verify second packet is flooded
-        params_1 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:03:03:03'},
+        params_2 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:03:03:03'},
                     {"layer": "Ethernet", "field": 'src', "value": '00:00:00:04:04:04'}]
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[1],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
-            "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[2],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
-            "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[3],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
-            "Packet is not received"
+        data.verify_packets_count([(params_1, {sniff_ports[1]: 1, sniff_ports[2]: 0, sniff_ports[3]: 0}),
+                                   (params_2, {sniff_ports[1]: 1, sniff_ports[2]: 1, sniff_ports[3]: 1})])
 
     def test_dynamic_fdb(self, env):
         """
@@ -195,18 +166,10 @@ class TestFdbSamples(object):
         packet = ({"Ethernet": {"src": "00:00:00:11:11:11", "dst": "00:00:00:05:05:05"}},
                   {"IP": {}}, {"TCP": {}})
         stream = env.tg[1].set_stream(packet, count=1, iface=sniff_ports[1])
-        env.tg[1].send_stream(stream)
-        env.tg[1].stop_streams()
-
-        self.suite_logger.debug("Verify Dynamic FDB is created")
-        # Verify Fdb record is added
-        fdb_table = env.switch[1].ui.get_table_fdb("Fdb")
-        fdb = {"portId": device_ports[1], "vlanId": 1,
-               "macAddress": "00:00:00:11:11:11", "type": "Dynamic"}
-        assert fdb in fdb_table, "Dynamic Fdb {0} was not added".format(fdb)
+        transmission = sample_helpers.StreamTransmission(env.tg[1], stream, sniff_ports[1], count=1)
 
         self.suite_logger.debug("Configure the test traffic to match created FDB")
-        # Generate test traffic
+        # Generate test traffic while learning frame is being sent
         packet_1 = ({"Ethernet": {"dst": "00:00:00:11:11:11", "src": "00:00:00:02:02:02"}},
                     {"IP": {}}, {"TCP": {}})
         packet_2 = ({"Ethernet": {"dst": "00:00:00:03:03:03", "src": "00:00:00:04:04:04"}},
@@ -216,6 +179,17 @@ class TestFdbSamples(object):
         stream_2 = env.tg[1].set_stream(packet_2, count=1, iface=sniff_ports[0])
         streams = [stream_1, stream_2]
 
+        # Wait until learning frame is sent
+        transmission.result()
+        env.tg[1].stop_streams([stream])
+
+        self.suite_logger.debug("Verify Dynamic FDB is created")
+        # Verify Fdb record is added
+        fdb_table = env.switch[1].ui.get_table_fdb("Fdb")
+        fdb = {"portId": device_ports[1], "vlanId": 1,
+               "macAddress": "00:00:00:11:11:11", "type": "Dynamic"}
+        assert fdb in fdb_table, "Dynamic Fdb {0} was not added".format(fdb)
+
         self.suite_logger.debug("Start the capture and send the test traffic")
         # Start capture
         env.tg[1].start_sniff(sniff_ports, sniffing_time=10)
@@ -224,50 +198,19 @@ class TestFdbSamples(object):
         env.tg[1].start_streams(streams)
 
         # Stop capture
-        data = env.tg[1].stop_sniff(sniff_ports)
+        data = sample_helpers.IndexedSniffData(env.tg[1].stop_sniff(sniff_ports), env.tg[1])
 
         # Stop traffic
         env.tg[1].stop_streams()
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         self.suite_logger.debug("Verify traffic is processed according to the FDB")
-        # Get packets from the captured data
-        # Verify first packet is sent only to second port
+        # Verify first packet is sent only to second port and second packet is flooded
         params_1 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:11:11:11'},
                     {"layer": "Ethernet", "field": 'src', "value": '00:00:00:02:02:02'}]
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[1],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
-            "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[2],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 0, \
-            "Packet is received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[3],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 0, \
-            "Packet is received"
-
-        # Verify second packet is flooded
-        params_1 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:03:03:03'},
+        params_2 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:03:03:03'},
                     {"layer": "Ethernet", "field": 'src', "value": '00:00:00:04:04:04'}]
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[1],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
-            "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[2],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
-            "Packet is not received"
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[3],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
-            "Packet is not received"
+        data.verify_packets_count([(params_1, {sniff_ports[1]: 1, sniff_ports[2]: 0, sniff_ports[3]: 0}),
+                                   (params_2, {sniff_ports[1]: 1, sniff_ports[2]: 1, sniff_ports[3]: 1})])
@@ -28,6 +28,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.igmp
 @pytest.mark.simplified
@@ -56,10 +58,9 @@ class TestIGMPSamples(object):
         assert self.wait_until_entry_is_expired(timeout=10, switch_instance=env.switch[2])
         @endco
         """
-        default_interval = switch_instance.ui.get_table_igmp_snooping_global_admin(
-            param="queryInterval")
-        default_robustness = switch_instance.ui.get_table_igmp_snooping_global_admin(
-            param="querierRobustness")
+        igmp_global = switch_instance.ui.get_table_igmp_snooping_global_admin()[0]
+        default_interval = igmp_global["queryInterval"]
+        default_robustness = igmp_global["querierRobustness"]
         min_querier_robustness = 1
         max_response_time = 10
         switch_instance.ui.configure_igmp_global(
@@ -70,22 +71,20 @@ class TestIGMPSamples(object):
             switch_instance.ui.configure_igmp_global(
                 query_interval=expected_timeout - max_response_time)
         # aging timeout is determined by the formula (queryInterval * querierRobustness) + (maxResponseTime) (+1 it is acceptable error)
-        timeout = (
-            switch_instance.ui.get_table_igmp_snooping_global_admin(param="queryInterval") +
-            switch_instance.ui.get_table_igmp_snooping_global_admin(
-                param="querierRobustness") + max_response_time)
-
-        # Get L2Multicast table
-        table = switch_instance.ui.get_table_l2_multicast()
-        # if table is not empty wait during the calculated timeout
-        if table:
-            time.sleep(timeout)
-            table = switch_instance.ui.get_table_l2_multicast()
-        self.suite_logger.debug("%s table for switch is :%s" % (table_name, table))
+        igmp_global = switch_instance.ui.get_table_igmp_snooping_global_admin()[0]
+        timeout = igmp_global["queryInterval"] * igmp_global["querierRobustness"] + max_response_time
+
+        # Poll L2Multicast table until all entries are expired
+        start_time = time.time()
+        is_expired = sample_helpers.wait_until(lambda: not switch_instance.ui.get_table_l2_multicast(),
+                                               timeout=timeout + 1, message="L2Multicast table is empty",
+                                               fail_on_timeout=False)
+        self.suite_logger.debug("%s table aging time: measured %.2f seconds, theoretical %s seconds" %
+                                (table_name, time.time() - start_time, timeout))
 
         # Verify table is empty
         try:
-            assert not table
+            assert is_expired
         except AssertionError:
             pytest.fail("Table %s is not empty." % table_name)
         else:
@@ -96,7 +95,7 @@ class TestIGMPSamples(object):
                 querier_robustness=default_robustness)
 
     def is_row_added_to_l2multicast_table(self, mac_address=None,
-                                          port_id=None, vlan_id=1, switch_instance=None):
+                                          port_id=None, vlan_id=1, switch_instance=None, timeout=5):
         """
         @brief Check if row with specified parameters added to L2Multicast table.
 
@@ -108,17 +107,19 @@ class TestIGMPSamples(object):
         @type  vlan_id:  int
         @param  switch_instance:  Switch class instance to work with
         @type  switch_instance:  SwitchGeneral
+        @param  timeout:  seconds to wait until entry is added
+        @type  timeout:  int
 
         @return  True or False
         @rtype: bool
         """
+        def is_row_added():
+            return any(row['macAddress'] == mac_address and row['portId'] == port_id and row['vlanId'] == vlan_id
+                       for row in switch_instance.ui.get_table_l2_multicast())
+
         # Need to wait untill entry will be added to L2Multicast table.
-        time.sleep(1)
-        table = switch_instance.ui.get_table_l2_multicast()
-        for row in table:
-            if row['macAddress'] == mac_address and row['portId'] == port_id and row['vlanId'] == vlan_id:
-                return True
-        return False
+        return sample_helpers.wait_until(is_row_added, timeout=timeout, message="L2Multicast entry is added",
+                                         fail_on_timeout=False)
 
     # Test Cases
     @pytest.mark.skip("Pypacker does not work properly with IP Options field and IGMP layer")
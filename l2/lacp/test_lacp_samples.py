@@ -23,13 +23,14 @@ Following test cases are tested:
 2. Verify that port can be added to(removed from) dynamic LAG.
 3. Verify that correct LACP frames are transmitted from the configured dynamic LAG.
 """
-import time
 from collections import defaultdict
 
 import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.lacp
 @pytest.mark.simplified
@@ -152,8 +153,17 @@ class TestLACPSamples(object):
                                           key=1,
                                           timeout='Short')
 
-        self.suite_logger.debug("Wait time to transit to defaulted state")
-        time.sleep(5)
+        self.suite_logger.debug("Wait until LAG ports transit to defaulted state")
+        lag_ports = [ports[("sw1", "tg1")][x] for x in range(1, 5)]
+
+        def are_ports_defaulted():
+            # actorOperPortState bits: expired, defaulted, distribute, collect, synch, aggregate, timeout, activity
+            defaulted_ports = {row['portId'] for lag in (3800, 3801)
+                               for row in env.switch[1].ui.get_table_lags_local_ports(lag=lag)
+                               if int(row['actorOperPortState'][1])}
+            return defaulted_ports == set(lag_ports)
+
+        sample_helpers.wait_until(are_ports_defaulted, timeout=15, message="LAG ports are in defaulted state")
 
         sniff_tg_ports = list(ports[("tg1", "sw1")].values())
 
@@ -182,7 +192,7 @@ class TestLACPSamples(object):
 
         data = env.tg[1].stop_sniff(sniff_tg_ports)
 
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data, max_frames=8)
 
         self.suite_logger.debug("Verify that correct LACP frames are sent from each LAG port.")
         for index in range(1, 5):
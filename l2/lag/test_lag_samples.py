@@ -28,6 +28,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.lag
 @pytest.mark.simplified
@@ -150,7 +152,7 @@ class TestLagSamples(object):
         data = env.tg[1].stop_sniff(sniff_ports)
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Get packets from the captured data
         # Verify first packet is sent only to second port
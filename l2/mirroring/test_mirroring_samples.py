@@ -27,6 +27,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.mirroring
 @pytest.mark.simplified
@@ -115,29 +117,29 @@ class TestMirroringSamples(object):
         env.tg[1].send_stream(stream)
 
         # Stop capture
-        data = env.tg[1].stop_sniff(sniff_ports)
+        data = sample_helpers.IndexedSniffData(env.tg[1].stop_sniff(sniff_ports), env.tg[1])
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         self.suite_logger.debug("Verify traffic is processed according to the FDB record")
         # Get packets from the captured data
         # Verify first packet is sent only to second port
         params_1 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:11:11:11'},
                     {"layer": "Ethernet", "field": 'src', "value": '00:00:00:02:02:02'}]
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[1],
-                                                    params=params_1,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[1],
+                                                 params=params_1)) == 1, \
             "Packet is not received"
 
         # Verify ingress packet is mirrored
         params_2 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:11:11:11'},
                     {"layer": "Ethernet", "field": 'src', "value": '00:00:00:02:02:02'},
                     {"layer": "Dot1Q", "field": 'vlan', "value": 1}]
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[2],
-                                                    params=params_2,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[2],
+                                                 params=params_2)) == 1, \
             "Packet is not received"
 
+        # Verify mirrored frame is the same as forwarded one regardless of Dot1Q tag
+        only_forwarded, only_mirrored = data.compare_ports(sniff_ports[1], sniff_ports[2],
+                                                           params=params_1, strip_dot1q=True)
+        assert not only_forwarded and not only_mirrored, "Mirrored frames differ from forwarded ones"
@@ -27,6 +27,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.multicast
 @pytest.mark.simplified
@@ -131,7 +133,7 @@ class TestMulticastSamples(object):
         data = env.tg[1].stop_sniff(sniff_ports)
 
         # Print sniffed data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify that packet_1 is forwarded to the port 2
         params = ({"layer": 'Ethernet', "field": 'dst', "value": '01:88:88:88:88:01'},)
@@ -151,7 +153,7 @@ class TestMulticastSamples(object):
         data = env.tg[1].stop_sniff(sniff_ports)
 
         # Print sniffed data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify that packet_2 is forwarded to the port 2
         params = ({"layer": 'Ethernet', "field": 'dst', "value": '01:88:88:88:88:02'},)
@@ -171,7 +173,7 @@ class TestMulticastSamples(object):
         data = env.tg[1].stop_sniff(sniff_ports)
 
         # Print sniffed data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify that packet_3 is forwarded to the port 2
         params = ({"layer": 'Ethernet', "field": 'dst', "value": '01:88:88:88:88:01'},)
@@ -191,7 +193,7 @@ class TestMulticastSamples(object):
         data = env.tg[1].stop_sniff(sniff_ports)
 
         # Print sniffed data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify that packet_4 is forwarded to the port 2
         params = ({"layer": 'Ethernet', "field": 'dst', "value": '01:88:88:88:88:02'},)
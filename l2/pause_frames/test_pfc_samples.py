@@ -29,6 +29,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.flow_control
 @pytest.mark.simplified
@@ -110,18 +112,10 @@ class TestPFCSamples(object):
         helpers.set_ports_admin_enabled(env.switch, ports)
 
         # Wait until ports will be in forwarding state.
-        helpers.wait_until_stp_state(switch_instance=env.switch[1], mode="RSTP",
-                                              state="Forwarding",
-                                              port=ports[('sw1', 'tg1')][1],
-                                              timeout=120)
-        helpers.wait_until_stp_state(switch_instance=env.switch[1], mode="RSTP",
-                                              state="Forwarding",
-                                              port=ports[('sw1', 'tg1')][2],
-                                              timeout=120)
-        helpers.wait_until_stp_state(switch_instance=env.switch[1], mode="RSTP",
-                                              state="Forwarding",
-                                              port=ports[('sw1', 'tg1')][3],
-                                              timeout=120)
+        sample_helpers.wait_until_ports_stp_state(env.switch[1], [ports[('sw1', 'tg1')][1],
+                                                                  ports[('sw1', 'tg1')][2],
+                                                                  ports[('sw1', 'tg1')][3]],
+                                                  state="Forwarding", timeout=120)
 
         # Configure stream of pause frame.
         pause_frame = ({"Ethernet": {"dst": "01:80:C2:00:00:01",
@@ -146,7 +140,7 @@ class TestPFCSamples(object):
         env.tg[1].send_stream(stream)
 
         data = env.tg[1].stop_sniff(sniff_ports)
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
         # Verify that Pause Frames are not forwarded from tested ports.
         params = ({'layer': "Ethernet",
                    'field': "dst",
@@ -191,18 +185,10 @@ class TestPFCSamples(object):
         helpers.set_ports_admin_enabled(env.switch, ports)
 
         # Wait until ports will be in forwarding state.
-        helpers.wait_until_stp_state(switch_instance=env.switch[1], mode="RSTP",
-                                              state="Forwarding",
-                                              port=ports[('sw1', 'tg1')][1],
-                                              timeout=120)
-        helpers.wait_until_stp_state(switch_instance=env.switch[1], mode="RSTP",
-                                              state="Forwarding",
-                                              port=ports[('sw1', 'tg1')][2],
-                                              timeout=120)
-        helpers.wait_until_stp_state(switch_instance=env.switch[1], mode="RSTP",
-                                              state="Forwarding",
-                                              port=ports[('sw1', 'tg1')][3],
-                                              timeout=120)
+        sample_helpers.wait_until_ports_stp_state(env.switch[1], [ports[('sw1', 'tg1')][1],
+                                                                  ports[('sw1', 'tg1')][2],
+                                                                  ports[('sw1', 'tg1')][3]],
+                                                  state="Forwarding", timeout=120)
 
         # Configure two streams of unicast packets.
         packet_1 = ({"Ethernet": {"dst": "00:00:00:00:00:33",
@@ -29,6 +29,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.qinq
 @pytest.mark.simplified
@@ -126,7 +128,7 @@ class TestQinQSamples(object):
 
         data = env.tg[1].stop_sniff(sniff_ports)
 
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify that packet is sending without double-tag from one Vlan
         # to another it will be received in correct port with double-tag
@@ -267,7 +269,7 @@ class TestQinQSamples(object):
         data = env.tg[1].stop_sniff(sniff_ports)
         env.tg[1].stop_streams([stream_id, stream_id_1])
 
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify that customer unmapped packet will be received
         # in correct port if it is send provider mapped packet
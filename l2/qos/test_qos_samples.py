@@ -30,6 +30,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.qos
 @pytest.mark.simplified
@@ -96,13 +98,14 @@ class TestQoSSamples(object):
 
         # Disable Flow Control functionality
         env.switch[1].ui.modify_ports(device_ports, flowControl='None')
-        for port in device_ports:
-            env.switch[1].ui.wait_for_port_status(port, 'flowControl', 'None', 10)
 
         # Disable Cut Through functionality
         env.switch[1].ui.modify_ports(device_ports, cutThrough='Disabled')
-        for port in device_ports:
-            env.switch[1].ui.wait_for_port_status(port, 'cutThrough', 'Disabled', 10)
+
+        # Wait until both are disabled on all ports
+        sample_helpers.wait_for_ports_status(env.switch[1],
+                                             {port: {'flowControl': 'None', 'cutThrough': 'Disabled'}
+                                              for port in device_ports}, timeout=10)
 
         # SetUp multicast and broadcast rate limits
         env.switch[1].ui.modify_ports(device_ports, setPortAttr="mcast_rate", attrVal=0)
@@ -220,13 +223,14 @@ class TestQoSSamples(object):
 
         # Disable Flow Control functionality
         env.switch[1].ui.modify_ports(device_ports, flowControl='None')
-        for port in device_ports:
-            env.switch[1].ui.wait_for_port_status(port, 'flowControl', 'None', 10)
 
         # Disable Cut Through functionality
         env.switch[1].ui.modify_ports(device_ports, cutThrough='Disabled')
-        for port in device_ports:
-            env.switch[1].ui.wait_for_port_status(port, 'cutThrough', 'Disabled', 10)
+
+        # Wait until both are disabled on all ports
+        sample_helpers.wait_for_ports_status(env.switch[1],
+                                             {port: {'flowControl': 'None', 'cutThrough': 'Disabled'}
+                                              for port in device_ports}, timeout=10)
 
         # SetUp multicast and broadcast rate limits
         env.switch[1].ui.modify_ports(device_ports, setPortAttr="mcast_rate", attrVal=0)
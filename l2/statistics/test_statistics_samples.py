@@ -23,12 +23,12 @@ Following test cases are tested:
 
 """
 
-import time
-
 import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.statistics
 @pytest.mark.simplified
@@ -80,16 +80,19 @@ class TestStatisticsSamples(object):
         self.suite_logger.debug("Send the test traffic")
         env.tg[1].send_stream(stream)
 
-        # Wait for Statistics to be updated
-        time.sleep(15)
-
-        # Get Statistics
-        port_0_tx_end = env.switch[1].ui.get_table_statistics(port=device_ports[0],
-                                                              stat_name='IfOutUcastPkts')
-        port_1_rx_end = env.switch[1].ui.get_table_statistics(port=device_ports[1],
-                                                              stat_name='IfInUcastPkts')
-        port_2_tx_end = env.switch[1].ui.get_table_statistics(port=device_ports[2],
-                                                              stat_name='IfOutUcastPkts')
+        # Wait for Statistics to be updated and get Statistics
+        port_0_tx_key = (device_ports[0], 'IfOutUcastPkts')
+        port_1_rx_key = (device_ports[1], 'IfInUcastPkts')
+        port_2_tx_key = (device_ports[2], 'IfOutUcastPkts')
+        statistics = sample_helpers.wait_for_statistics_settle(
+            env.switch[1], [port_0_tx_key, port_1_rx_key, port_2_tx_key], quiet_period=5,
+            targets={port_0_tx_key: int(port_0_tx) + 100,
+                     port_1_rx_key: int(port_1_rx) + 100,
+                     port_2_tx_key: int(port_2_tx) + 100},
+            timeout=15)
+        port_0_tx_end = statistics[port_0_tx_key]
+        port_1_rx_end = statistics[port_1_rx_key]
+        port_2_tx_end = statistics[port_2_tx_key]
 
         # Verify Statistics values
         assert int(port_1_rx_end) - int(port_1_rx) == 100, 'Rx Statistics is wrong'
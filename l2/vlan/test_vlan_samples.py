@@ -28,6 +28,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.vlan
 @pytest.mark.simplified
@@ -140,10 +142,10 @@ class TestVlanSamples(object):
         env.tg[1].send_stream(stream)
 
         # Stop capture
-        data = env.tg[1].stop_sniff(sniff_ports)
+        data = sample_helpers.IndexedSniffData(env.tg[1].stop_sniff(sniff_ports), env.tg[1])
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Get packets from the captured data
         # Verify first packet is sent only to second port
@@ -151,15 +153,11 @@ class TestVlanSamples(object):
                   {"layer": "Ethernet", "field": 'src', "value": '00:00:02:02:02:02'}]
 
         #Traffic should be forwarded from Vlan ports
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[1],
-                                                    params=params,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 1, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[1],
+                                                 params=params)) == 1, \
             "Packet is not received"
 
         # Traffic should not be forwarded from non-Vlan ports
-        assert len(helpers.get_packet_from_the_port(sniff_port=sniff_ports[2],
-                                                    params=params,
-                                                    sniff_data=data,
-                                                    tg=env.tg[1])) == 0, \
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[2],
+                                                 params=params)) == 0, \
             "Packet is received"
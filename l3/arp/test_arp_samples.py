@@ -29,6 +29,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.layer3
 @pytest.mark.simplified
@@ -185,7 +187,7 @@ class TestArpSamples(object):
         data = env.tg[1].stop_sniff([ports[('tg1', 'sw1')][2]])
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         self.suite_logger.debug("Verify traffic is processed according to the ARP records")
         # Get packets from the captured data
@@ -257,7 +259,7 @@ class TestArpSamples(object):
         data = env.tg[1].stop_sniff([ports[('tg1', 'sw1')][2]])
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         self.suite_logger.debug("Verify ARP request has been sent")
         # Get packets from the captured data
@@ -349,7 +351,7 @@ class TestArpSamples(object):
         data = env.tg[1].stop_sniff([ports[('tg1', 'sw1')][2]])
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         self.suite_logger.debug("Verify ARP request has been sent")
         # Get packets from the captured data
@@ -391,7 +393,7 @@ class TestArpSamples(object):
         data = env.tg[1].stop_sniff([ports[('tg1', 'sw1')][2]])
 
         # Print captured data
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         self.suite_logger.debug("Verify traffic is processed according to the ARP records")
         # Get packets from the captured data
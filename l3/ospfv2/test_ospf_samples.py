@@ -28,6 +28,8 @@ import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.layer3
 class TestOSPFSamples(object):
@@ -48,24 +50,36 @@ class TestOSPFSamples(object):
         @typr  record_count:  int
         @raise: pytest.fail in case Route table doesn't contain expected number of records
         @return  None
+        @note  Only Route table size is polled if switch supports getprop_size,
+               otherwise the whole table is read every 20 seconds.
         @par  Example:
         @code
         self._wait_for_route_table_loading(env.switch[1], 120, 9)
         @endcode
         """
-        end_time = time.time() + interval
-        start_count = 0
-        while time.time() <= end_time:
-            table_length = len(switch.ui.get_table_route())
-            # Add log message on lenght changes
-            if table_length != start_count:
+        start_time = time.time()
+        # Route table size changes: [(seconds, records count)]
+        loading_curve = [(0, 0)]
+
+        def is_loaded():
+            if hasattr(switch, 'getprop_size'):
+                table_length = switch.getprop_size('Route')
+            else:
+                table_length = len(switch.ui.get_table_route())
+            # Add log message on length changes
+            if table_length != loading_curve[-1][1]:
                 self.suite_logger.debug('Route table has {} records'.format(table_length))
-                start_count = table_length
-            if table_length >= record_count:
-                return
-            # Route table needs long time to update
-            time.sleep(20)
-        pytest.fail("Route table does not have {} records after {} seconds elapsed".format(record_count, interval))
+                loading_curve.append((time.time() - start_time, table_length))
+            return table_length >= record_count
+
+        # Route table needs long time to update. Reading the whole table is expensive,
+        # so polling interval grows only if table size is read separately
+        poll_interval = 0.1 if hasattr(switch, 'getprop_size') else 20
+        self.suite_logger.debug('Wait until Route table has {} records'.format(record_count))
+        sample_helpers.wait_until(is_loaded, timeout=interval, interval=poll_interval, max_interval=20,
+                                  message="Route table is loaded")
+        self.suite_logger.info('Route table loading curve (seconds, records): {}'.format(
+            ', '.join('({:.1f}, {})'.format(*point) for point in loading_curve)))
 
     @pytest.mark.simplified
     @pytest.mark.skip("Pypacker does not support OSPF protocol properly")
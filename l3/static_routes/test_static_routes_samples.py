@@ -22,12 +22,12 @@ Following test cases are tested:
 1. Verify traffic forwarding upon two port on one VLAN and one Router Interface.
 2. Verify static route behavior upon one port with two VLANs.
 """
-import time
-
 import pytest
 
 from testlib import helpers
 
+from testcases import sample_helpers
+
 
 @pytest.mark.layer3
 @pytest.mark.simplified
@@ -113,7 +113,7 @@ class TestStaticRoutesSamples(object):
         # Get sniffer data
         data = env.tg[1].stop_sniff(sniff_ports)
 
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify who-has "20.0.10.2" ARP requests received.
         params_1 = [{"layer": "Ethernet", "field": 'dst', "value": 'ff:ff:ff:ff:ff:ff'},
@@ -135,12 +135,10 @@ class TestStaticRoutesSamples(object):
         stream_id = env.tg[1].set_stream(arp_reply, count=1, iface=ports[('tg1', 'sw1')][2])
         env.tg[1].send_stream(stream_id)
 
-        time.sleep(2)
-
         # Verify ARP entry has been added
-        arp_table = env.switch[1].ui.get_table_arp(mode='arp')
-        assert self.is_arp_added(arps=arp_table, mac='00:00:14:00:0a:02',
-                                 ip='20.0.10.2'), 'ARP entry was not added'
+        sample_helpers.wait_until(lambda: self.is_arp_added(arps=env.switch[1].ui.get_table_arp(mode='arp'),
+                                                            mac='00:00:14:00:0a:02', ip='20.0.10.2'),
+                                  timeout=10, message='ARP entry is added')
 
         # Start sniffer
         env.tg[1].start_sniff(sniff_ports, sniffing_time=10)
@@ -158,7 +156,7 @@ class TestStaticRoutesSamples(object):
         # Stop sniffer
         data = env.tg[1].stop_sniff(sniff_ports)
 
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify packet with destination 10.10.10.101 is not forwarded back to port 1.
         params_2 = [{"layer": "IP", "field": 'dst', "value": '10.10.10.101'},
@@ -242,7 +240,7 @@ class TestStaticRoutesSamples(object):
         # Get sniffer data
         data = env.tg[1].stop_sniff(sniff_ports)
 
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify who-has "20.0.34.5" ARP requests received.
         params_1 = [{"layer": "Ethernet", "field": 'dst', "value": 'ff:ff:ff:ff:ff:ff'},
@@ -264,12 +262,10 @@ class TestStaticRoutesSamples(object):
         stream_id = env.tg[1].set_stream(arp_reply, count=1, iface=ports[('tg1', 'sw1')][1])
         env.tg[1].send_stream(stream_id)
 
-        time.sleep(2)
-
         # Verify ARP entry has been added
-        arp_table = env.switch[1].ui.get_table_arp(mode='arp')
-        assert self.is_arp_added(arps=arp_table, mac='00:00:14:00:22:05',
-                                 ip='20.0.34.5'), 'ARP entry was not added'
+        sample_helpers.wait_until(lambda: self.is_arp_added(arps=env.switch[1].ui.get_table_arp(mode='arp'),
+                                                            mac='00:00:14:00:22:05', ip='20.0.34.5'),
+                                  timeout=10, message='ARP entry is added')
 
         # Start sniffer
         env.tg[1].start_sniff(sniff_ports, sniffing_time=10)
@@ -286,7 +282,7 @@ class TestStaticRoutesSamples(object):
         # Stop sniffer
         data = env.tg[1].stop_sniff(sniff_ports)
 
-        helpers.print_sniffed_data_brief(data)
+        sample_helpers.print_sniffed_data_brief(data)
 
         # Verify that TG port 1 receive IP packet with destination 10.10.10.101
         params_2 = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:14:00:22:05'},
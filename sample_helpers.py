@@ -0,0 +1,578 @@
+"""
+@copyright Copyright (c) 2011 - 2016, Intel Corporation.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+@file  sample_helpers.py
+
+@summary  Helpers shared by sample test suites.
+
+@note  Repository root is a package and py.test adds its parent directory to
+       sys.path when it loads the root conftest.py, so suites import this module
+       as testcases.sample_helpers.
+       The module is also registered as py.test plugin in conftest.py to report
+       wait_until timings at the end of the run.
+"""
+
+import hashlib
+import logging
+import time
+from collections import Counter, defaultdict
+
+import pytest
+
+from testlib import loggers
+from testlib import helpers
+
+
+mod_logger = loggers.module_logger(__name__)
+
+
+class IndexedSniffData(dict):
+    """
+    @description  Captured data returned by tg.stop_sniff with per-port field index.
+
+    @note  Behaves as the original {port: [packets]} dictionary, so it can be
+           passed to any helpers function. Index for every (layer, field) pair is
+           built lazily on the first query and then reused, so repeated queries
+           over the same capture are dictionary lookups instead of port rescans.
+           Fields with unhashable values are not indexed and are matched by scan.
+           Captured data is a snapshot: do not modify packet lists after indexing.
+    """
+
+    def __init__(self, sniff_data, tg):
+        """
+        @brief  Initialize IndexedSniffData class
+        @param  sniff_data:  data returned by tg.stop_sniff
+        @type  sniff_data:  dict
+        @param  tg:  traffic generator instance
+        @type  tg:  GenericTG
+        """
+        super(IndexedSniffData, self).__init__(sniff_data)
+        self.tg = tg
+        # {port: {(layer, field): {value: [packet_positions]}}}, None instead of
+        # {value: [packet_positions]} if field values are unhashable
+        self._index = defaultdict(dict)
+        # {(port, strip_dot1q): [frame_digests]}
+        self._digests = {}
+
+    def _build_index(self, sniff_port, fields):
+        """
+        @brief  Index all not yet indexed (layer, field) pairs in one pass over port's frames
+        @param  sniff_port:  TG port
+        @type  sniff_port:  str
+        @param  fields:  (layer, field) pairs
+        @type  fields:  iter(tuple)
+        @rtype:  dict
+        @return:  port index {(layer, field): {value: [packet_positions]}}
+        """
+        port_index = self._index[sniff_port]
+        new_fields = set(fields) - set(port_index)
+        if new_fields:
+            for key in new_fields:
+                port_index[key] = defaultdict(list)
+            for position, packet in enumerate(self.get(sniff_port, [])):
+                for layer, field in new_fields:
+                    values = port_index[layer, field]
+                    if values is not None and self.tg.get_packet_layer(packet=packet, layer=layer) is not None:
+                        value = self.tg.get_packet_field(packet=packet, layer=layer, field=field)
+                        try:
+                            values[value].append(position)
+                        except TypeError:
+                            # Unhashable value, field is matched by scan
+                            port_index[layer, field] = None
+        return port_index
+
+    def _is_matched(self, packet, row):
+        """
+        @brief  Check if packet matches condition without index
+        @param  packet:  captured packet
+        @type  packet:  pypacker.Packet
+        @param  row:  {"layer": LAYER, "field": FIELD, "value": VALUE} condition
+        @type  row:  dict
+        @rtype:  bool
+        @return:  True if packet contains layer and field has expected value
+        """
+        return (self.tg.get_packet_layer(packet=packet, layer=row["layer"]) is not None and
+                self.tg.get_packet_field(packet=packet, layer=row["layer"], field=row["field"]) == row["value"])
+
+    def _get_positions(self, sniff_port, params):
+        """
+        @brief  Get positions of port's packets which match all conditions
+        @param  sniff_port:  TG port
+        @type  sniff_port:  str
+        @param  params:  list of {"layer": LAYER, "field": FIELD, "value": VALUE} conditions
+        @type  params:  list(dict)
+        @rtype:  list(int)
+        @return:  packet positions in capture order
+        @note  Positions of the most selective indexed condition are filtered by
+               the other conditions, so query cost doesn't depend on capture size.
+        """
+        port_index = self._build_index(sniff_port, ((row["layer"], row["field"]) for row in params))
+        candidates = []
+        scanned = []
+        for row in params:
+            values = port_index[row["layer"], row["field"]]
+            if values is not None:
+                try:
+                    candidates.append(values.get(row["value"], []))
+                    continue
+                except TypeError:
+                    # Unhashable expected value
+                    pass
+            scanned.append(row)
+
+        packets = self.get(sniff_port, [])
+        if candidates:
+            candidates.sort(key=len)
+            positions = candidates[0]
+            for other in candidates[1:]:
+                if not positions:
+                    break
+                other = set(other)
+                positions = [x for x in positions if x in other]
+        else:
+            positions = range(len(packets))
+        if scanned:
+            positions = [x for x in positions if all(self._is_matched(packets[x], row) for row in scanned)]
+        return list(positions)
+
+    def get_packet_from_the_port(self, sniff_port=None, params=None):
+        """
+        @brief  Indexed equivalent of helpers.get_packet_from_the_port
+        @param  sniff_port:  TG port
+        @type  sniff_port:  str
+        @param  params:  list of {"layer": LAYER, "field": FIELD, "value": VALUE} conditions
+        @type  params:  list(dict)
+        @rtype:  list
+        @return:  captured packets which match all conditions
+        @par  Example:
+        @code
+        data = IndexedSniffData(env.tg[1].stop_sniff(sniff_ports), env.tg[1])
+        params = [{"layer": "Ethernet", "field": 'dst', "value": '00:00:00:11:11:11'}]
+        assert len(data.get_packet_from_the_port(sniff_port=sniff_ports[1], params=params)) == 1
+        @endcode
+        """
+        packets = self.get(sniff_port, [])
+        return [packets[x] for x in self._get_positions(sniff_port, params or [])]
+
+    def verify_packets_count(self, expectations):
+        """
+        @brief  Verify number of captured packets for set of conditions on set of ports
+        @param  expectations:  list of (params, {sniff_port: expected_count}) pairs
+        @type  expectations:  list(tuple)
+        @raise  pytest.fail:  list of all mismatches
+        @return  None
+        @note  All (layer, field) pairs used in expectations are indexed in single pass
+               over each port's frames.
+        @par  Example:
+        @code
+        data.verify_packets_count([(params_1, {sniff_ports[1]: 1, sniff_ports[2]: 0}),
+                                   (params_2, {sniff_ports[1]: 1, sniff_ports[2]: 1})])
+        @endcode
+        """
+        fields = defaultdict(set)
+        for params, ports_count in expectations:
+            for sniff_port in ports_count:
+                fields[sniff_port].update((row["layer"], row["field"]) for row in params)
+        for sniff_port, port_fields in fields.items():
+            self._build_index(sniff_port, port_fields)
+
+        failures = []
+        for params, ports_count in expectations:
+            for sniff_port, expected_count in ports_count.items():
+                count = len(self.get_packet_from_the_port(sniff_port=sniff_port, params=params))
+                if count != expected_count:
+                    failures.append("Port {0}: expected {1} packets, received {2}. Conditions: {3}".format(
+                        sniff_port, expected_count, count, params))
+        if failures:
+            pytest.fail("\n".join(failures))
+
+    def get_packets_count(self, fields, sniff_ports=None):
+        """
+        @brief  Count captured packets grouped by port and values of given fields
+        @param  fields:  (layer, field) pairs to group by (per port totals if empty)
+        @type  fields:  list(tuple)
+        @param  sniff_ports:  TG ports (all captured ports if None)
+        @type  sniff_ports:  list
+        @raise  TypeError:  field values are unhashable
+        @rtype:  collections.Counter
+        @return:  {(sniff_port, value_1, ..., value_N): packets_count}
+        @note  Packets which don't contain all layers are not counted.
+        @par  Example:
+        @code
+        counts = data.get_packets_count([("Ethernet", "dst"), ("Dot1Q", "prio")])
+        assert counts[sniff_ports[1], '00:00:00:11:11:11', 6] == 100
+        totals = data.get_packets_count([])
+        assert totals[sniff_ports[1], ] >= 100
+        @endcode
+        """
+        counts = Counter()
+        for sniff_port in (self if sniff_ports is None else sniff_ports):
+            if not fields:
+                counts[sniff_port, ] = len(self.get(sniff_port, []))
+                continue
+            port_index = self._build_index(sniff_port, fields)
+            columns = []
+            for key in fields:
+                if port_index[key] is None:
+                    raise TypeError("Values of {0} {1} field are unhashable".format(*key))
+                column = {}
+                for value, positions in port_index[key].items():
+                    column.update(dict.fromkeys(positions, value))
+                columns.append(column)
+            for position in set(columns[0]).intersection(*columns[1:]):
+                counts[(sniff_port, ) + tuple(column[position] for column in columns)] += 1
+        return counts
+
+    def get_frames_digests(self, sniff_port, strip_dot1q=False):
+        """
+        @brief  Get digests of raw captured frames
+        @param  sniff_port:  TG port
+        @type  sniff_port:  str
+        @param  strip_dot1q:  remove outer Dot1Q tag before calculating digest
+        @type  strip_dot1q:  bool
+        @rtype:  list(str)
+        @return:  frame digests in capture order
+        @note  Untagged frame is padded to minimal Ethernet frame size as device does
+               on tag removal, so the same frame has the same digest regardless of tag.
+        """
+        key = (sniff_port, strip_dot1q)
+        if key not in self._digests:
+            digests = []
+            for packet in self.get(sniff_port, []):
+                raw = packet.bin()
+                if strip_dot1q and raw[12:14] == b"\x81\x00":
+                    raw = (raw[:12] + raw[16:]).ljust(60, b"\x00")
+                digests.append(hashlib.sha1(raw).digest())
+            self._digests[key] = digests
+        return self._digests[key]
+
+    def compare_ports(self, port_1, port_2, params=None, strip_dot1q=False):
+        """
+        @brief  Compare multisets of frames captured on two ports
+        @param  port_1:  TG port
+        @type  port_1:  str
+        @param  port_2:  TG port
+        @type  port_2:  str
+        @param  params:  compare only frames which match all conditions
+        @type  params:  list(dict)
+        @param  strip_dot1q:  ignore outer Dot1Q tag
+        @type  strip_dot1q:  bool
+        @rtype:  tuple(collections.Counter)
+        @return:  frame digests received only on port_1 and only on port_2
+        @par  Example:
+        @code
+        only_1, only_2 = data.compare_ports(sniff_ports[1], sniff_ports[2], strip_dot1q=True)
+        assert not only_1 and not only_2, "Frames are not mirrored"
+        @endcode
+        """
+        frames = []
+        for sniff_port in (port_1, port_2):
+            digests = self.get_frames_digests(sniff_port, strip_dot1q)
+            frames.append(Counter(digests[x] for x in self._get_positions(sniff_port, params or [])))
+        return frames[0] - frames[1], frames[1] - frames[0]
+
+
+def print_sniffed_data_brief(data, logger=None, max_frames=None):
+    """
+    @brief  Lazy equivalent of helpers.print_sniffed_data_brief
+    @param  data:  data returned by tg.stop_sniff or IndexedSniffData
+    @type  data:  dict
+    @param  logger:  logger of captured data, helpers module logger by default
+    @type  logger:  logging.Logger
+    @param  max_frames:  print per port counters (and per flow counters for IndexedSniffData)
+                         and only first and last frames of each port if port has more frames
+    @type  max_frames:  int
+    @return  None
+    @note  Nothing is formatted unless logger is enabled for DEBUG level. Frames are
+           printed by helpers.print_sniffed_data_brief, so default logger is the one
+           it writes to.
+    @par  Example:
+    @code
+    print_sniffed_data_brief(data)
+    print_sniffed_data_brief(data, max_frames=10)
+    @endcode
+    """
+    if logger is None:
+        logger = helpers.mod_logger
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    if max_frames is None:
+        helpers.print_sniffed_data_brief(data)
+        return
+
+    for sniff_port, packets in data.items():
+        logger.debug("Port %s: %s frames captured", sniff_port, len(packets))
+    if isinstance(data, IndexedSniffData):
+        flows = data.get_packets_count([("Ethernet", "src"), ("Ethernet", "dst")])
+        for (sniff_port, src, dst), count in flows.items():
+            logger.debug("Port %s: %s -> %s: %s frames", sniff_port, src, dst, count)
+
+    head = max_frames - max_frames // 2
+    tail = max_frames // 2
+    helpers.print_sniffed_data_brief(
+        {port: packets if len(packets) <= max_frames else packets[:head] + packets[len(packets) - tail:]
+         for port, packets in data.items()})
+
+
+class StreamTransmission(object):
+    """
+    @description  Stream transmission started without waiting for its completion.
+
+    @note  Completion is defined by TG port sent frames counter, so caller can do other
+           configuration steps while stream is being sent.
+    """
+
+    def __init__(self, tg, stream, iface, count):
+        """
+        @brief  Start stream transmission
+        @param  tg:  traffic generator instance
+        @type  tg:  GenericTG
+        @param  stream:  stream ID returned by tg.set_stream
+        @type  stream:  int
+        @param  iface:  TG port the stream is configured on
+        @type  iface:  str
+        @param  count:  number of frames configured in the stream
+        @type  count:  int
+        """
+        self.tg = tg
+        self.stream = stream
+        self.iface = iface
+        self.count = count
+        self._initial_count = tg.get_sent_frames_count(iface)
+        tg.start_streams([stream])
+
+    def done(self):
+        """
+        @brief  Check if all stream frames have been sent
+        @rtype:  bool
+        @return:  True if TG port sent frames counter reached stream frames count
+        """
+        return self.tg.get_sent_frames_count(self.iface) - self._initial_count >= self.count
+
+    def result(self, timeout=30):
+        """
+        @brief  Wait until all stream frames have been sent
+        @param  timeout:  seconds to wait
+        @type  timeout:  int
+        @raise  pytest.fail:  stream has not been sent during timeout
+        @return  None
+        """
+        mod_logger.debug("Wait until stream %s sends %s frames from port %s", self.stream, self.count, self.iface)
+        if not wait_until(self.done, timeout=timeout, message="Stream frames are sent", fail_on_timeout=False):
+            pytest.fail("Stream {0} has not sent {1} frames from port {2} after {3} seconds".format(
+                self.stream, self.count, self.iface, timeout))
+
+
+# {condition message: [seconds until condition was met]}
+WAIT_TIMINGS = defaultdict(list)
+
+
+def wait_until(condition, timeout=60, message="condition", interval=0.1, max_interval=5,
+               backoff=2, fail_on_timeout=True):
+    """
+    @brief  Poll condition until it is met or timeout expires
+    @param  condition:  callable without arguments; condition is met when it returns True value
+    @type  condition:  function
+    @param  timeout:  seconds to wait
+    @type  timeout:  int | float
+    @param  message:  fixed condition name used in logs, failure message and WAIT_TIMINGS
+    @type  message:  str
+    @param  interval:  seconds before the second poll
+    @type  interval:  int | float
+    @param  max_interval:  maximum seconds between polls
+    @type  max_interval:  int | float
+    @param  backoff:  interval multiplier applied after each poll
+    @type  backoff:  int | float
+    @param  fail_on_timeout:  call pytest.fail if condition is not met during timeout
+    @type  fail_on_timeout:  bool
+    @raise  pytest.fail:  condition is not met during timeout
+    @return:  last condition result
+    @note  Polls are frequent at the beginning and become rarer with time, so fast
+           conditions are detected quickly and slow ones don't overload device.
+           Time until condition is met is logged and stored in WAIT_TIMINGS by
+           message, so message must not contain ports, IDs or other variable
+           details: log them separately.
+    @par  Example:
+    @code
+    wait_until(lambda: env.switch[1].ui.get_table_arp(mode='arp'), timeout=10,
+               message="ARP entry is added")
+    @endcode
+    """
+    start_time = time.time()
+    end_time = start_time + timeout
+    polls = 0
+    while True:
+        polls += 1
+        result = condition()
+        elapsed = time.time() - start_time
+        if result:
+            WAIT_TIMINGS[message].append(elapsed)
+            mod_logger.info("Condition '%s' is met after %.2f seconds (%s polls)", message, elapsed, polls)
+            return result
+        remaining = end_time - time.time()
+        if remaining <= 0:
+            mod_logger.info("Condition '%s' is not met after %s seconds (%s polls)", message, timeout, polls)
+            if fail_on_timeout:
+                pytest.fail("Condition '{0}' is not met after {1} seconds".format(message, timeout))
+            return result
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
+# Report measured conditions timings
+def pytest_terminal_summary(terminalreporter):
+    if WAIT_TIMINGS:
+        terminalreporter.write_sep("-", "wait_until timings")
+        for message, timings in sorted(WAIT_TIMINGS.items()):
+            terminalreporter.write_line("{0}: {1} times, min {2:.2f}s, max {3:.2f}s".format(
+                message, len(timings), min(timings), max(timings)))
+
+
+def wait_for_statistics_settle(switch, counters, quiet_period=2, targets=None, timeout=30):
+    """
+    @brief  Wait until switch statistics counters stop changing or reach expected values
+    @param  switch:  switch instance
+    @type  switch:  SwitchGeneral
+    @param  counters:  list of (port, stat_name) pairs
+    @type  counters:  list(tuple)
+    @param  quiet_period:  seconds counters have to stay unchanged
+    @type  quiet_period:  int | float
+    @param  targets:  {(port, stat_name): value}; wait is finished when all counters reach values
+    @type  targets:  dict
+    @param  timeout:  seconds to wait
+    @type  timeout:  int | float
+    @rtype:  dict
+    @return:  {(port, stat_name): value}
+    @note  Quiet period starts from the first read and is restarted on every
+           counter change, so quiet_period has to be longer than statistics update
+           period of the device. Last read values are returned after timeout, so
+           caller verifies them as usual.
+    @par  Example:
+    @code
+    counters = [(1, 'IfInUcastPkts'), (2, 'IfOutUcastPkts')]
+    statistics = wait_for_statistics_settle(env.switch[1], counters, targets={(1, 'IfInUcastPkts'): 100})
+    @endcode
+    """
+    start_time = time.time()
+    state = {"values": None, "changed": None}
+    settle_times = {}
+
+    def is_settled():
+        values = {key: int(switch.ui.get_table_statistics(port=key[0], stat_name=key[1])) for key in counters}
+        now = time.time()
+        if state["values"] is None:
+            state["changed"] = now
+        else:
+            for key, value in values.items():
+                if state["values"][key] != value:
+                    settle_times[key] = now - start_time
+                    state["changed"] = now
+        state["values"] = values
+        if targets and all(values[key] >= value for key, value in targets.items()):
+            return True
+        return now - state["changed"] >= quiet_period
+
+    wait_until(is_settled, timeout=timeout, message="Statistics counters are settled",
+               max_interval=quiet_period / 2., fail_on_timeout=False)
+    for key in counters:
+        if key in settle_times:
+            mod_logger.info("Port %s %s is settled after %.2f seconds with value %s",
+                            key[0], key[1], settle_times[key], state["values"][key])
+        else:
+            mod_logger.info("Port %s %s is not changed, value %s", key[0], key[1], state["values"][key])
+    return state["values"]
+
+
+def wait_until_ports_stp_state(switch, ports, state="Forwarding", timeout=120):
+    """
+    @brief  Wait until all ports have the same RSTP state
+    @param  switch:  switch instance
+    @type  switch:  SwitchGeneral
+    @param  ports:  switch ports
+    @type  ports:  list(int)
+    @param  state:  expected RSTP port state
+    @type  state:  str
+    @param  timeout:  seconds to wait
+    @type  timeout:  int
+    @raise  pytest.fail:  not all ports have expected state after timeout
+    @rtype:  dict
+    @return:  {port: seconds until port reached expected state}
+    @note  RSTP ports table is read once per poll for all ports.
+    @par  Example:
+    @code
+    wait_until_ports_stp_state(env.switch[1], [1, 2, 3], state="Forwarding", timeout=120)
+    @endcode
+    """
+    start_time = time.time()
+    convergence_times = {}
+
+    def are_ports_in_state():
+        elapsed = time.time() - start_time
+        ports_in_state = {row["portId"] for row in switch.ui.get_table_rstp_ports()
+                          if row["portId"] in ports and row["state"] == state}
+        for port in ports:
+            if port in ports_in_state:
+                convergence_times.setdefault(port, elapsed)
+            else:
+                convergence_times.pop(port, None)
+        return len(ports_in_state) == len(set(ports))
+
+    mod_logger.debug("Wait until ports %s are in %s RSTP state", ports, state)
+    if not wait_until(are_ports_in_state, timeout=timeout, message="Ports are in RSTP state",
+                      fail_on_timeout=False):
+        pytest.fail("Ports {0} are not in {1} RSTP state after {2} seconds".format(
+            sorted(set(ports) - set(convergence_times)), state, timeout))
+    for port in ports:
+        mod_logger.info("Port %s is in %s RSTP state after %.2f seconds", port, state, convergence_times[port])
+    return convergence_times
+
+
+def wait_for_ports_status(switch, expected_status, timeout=10):
+    """
+    @brief  Wait until ports attributes have expected values
+    @param  switch:  switch instance
+    @type  switch:  SwitchGeneral
+    @param  expected_status:  {port: {attribute: value}}
+    @type  expected_status:  dict{dict}
+    @param  timeout:  seconds to wait
+    @type  timeout:  int
+    @raise  pytest.fail:  not all ports attributes have expected values after timeout
+    @return  None
+    @note  Ports table is read once per poll for all ports.
+    @par  Example:
+    @code
+    wait_for_ports_status(env.switch[1], {port: {'flowControl': 'None'} for port in device_ports})
+    @endcode
+    """
+    # {(port, attribute): actual value}
+    mismatches = {}
+
+    def is_status_set():
+        rows = switch.ui.get_table_ports(ports=list(expected_status), all_params=True)
+        ports_status = {row["portId"]: row for row in rows}
+        mismatches.clear()
+        for port, attrs in expected_status.items():
+            for attr, value in attrs.items():
+                actual_value = ports_status.get(port, {}).get(attr)
+                if actual_value != value:
+                    mismatches[port, attr] = actual_value
+        return not mismatches
+
+    mod_logger.debug("Wait until ports %s have expected status", sorted(expected_status))
+    if not wait_until(is_status_set, timeout=timeout, message="Ports have expected status",
+                      fail_on_timeout=False):
+        pytest.fail("Ports attributes don't have expected values after {0} seconds: {1}".format(
+            timeout, ", ".join("port {0} {1}={2}, expected {3}".format(port, attr, value, expected_status[port][attr])
+                               for (port, attr), value in sorted(mismatches.items()))))